@@ -14,18 +14,18 @@
 # - PDF logo shifted slightly left + ~40% more space under logo
 # - Results page includes: Summary, Export, Allocation Caps, Alternatives gating, Robustness, File note
 
-import base64
+import json
+from bisect import bisect_left
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime
 from io import BytesIO
 
+import numpy as np
 import streamlit as st
 
-# PDF
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import mm
-from reportlab.lib.utils import ImageReader
+# PDF: reportlab is imported lazily inside the PDF helpers so the
+# questionnaire's first paint doesn't pay for it.
 
 # ============================================================
 # PAGE CONFIG
@@ -47,36 +47,43 @@ ACCENT = "#D2A679"
 # ============================================================
 # LOGO FILES
 # ============================================================
-UI_LOGO_FILE = "Logo_white.png"      # UI header logo
+UI_LOGO_FILE = "static/Logo_white.png"      # UI header logo (served as a static file)
+UI_LOGO_URL = "app/static/Logo_white.png"    # browser-cacheable URL for UI_LOGO_FILE
 PDF_LOGO_FILE = "Logo_orange.png"    # PDF-only logo
 
 # ============================================================
 # HELPERS
 # ============================================================
-def load_logo_base64(filename: str) -> str | None:
-    p = Path(filename)
-    if not p.exists():
-        return None
-    return base64.b64encode(p.read_bytes()).decode("utf-8")
+# PDF logo loader is cached per (filename, mtime) so reruns reuse the decoded
+# image, while replacing the file on disk still invalidates the cache
+# (max_entries evicts readers left behind by older mtimes).
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_logo_for_pdf(filename: str, mtime_ns: int):
+    from reportlab.lib.utils import ImageReader
+
+    reader = ImageReader(filename)  # reads the file into memory, no open handle
+    reader.getRGBData()  # decode the PNG now; the reader keeps the pixel data
+    return reader
 
 def load_logo_for_pdf(filename: str):
     p = Path(filename)
     if not p.exists():
         return None
-    return ImageReader(str(p))
+    return _cached_logo_for_pdf(str(p), p.stat().st_mtime_ns)
 
 def wrap_text_to_lines(text: str, max_chars: int) -> list[str]:
-    words = (text or "").split()
-    lines, cur = [], ""
-    for w in words:
-        if len(cur) + len(w) + (1 if cur else 0) <= max_chars:
-            cur = f"{cur} {w}".strip()
+    # Greedy wrap: collect words per line with a running length, join once per line
+    lines, cur, cur_len = [], [], 0
+    for w in (text or "").split():
+        add = len(w) + (1 if cur else 0)
+        if cur and cur_len + add > max_chars:
+            lines.append(" ".join(cur))
+            cur, cur_len = [w], len(w)
         else:
-            if cur:
-                lines.append(cur)
-            cur = w
+            cur.append(w)
+            cur_len += add
     if cur:
-        lines.append(cur)
+        lines.append(" ".join(cur))
     return lines
 
 # ============================================================
@@ -84,7 +91,11 @@ def wrap_text_to_lines(text: str, max_chars: int) -> list[str]:
 # - logo x shifted left by 2mm
 # - vertical spacing under logo increased by ~40%
 # ============================================================
-def build_pdf_bytes(results: dict, firm_name: str = "Amberstone Capital", logo_file: str = PDF_LOGO_FILE) -> bytes:
+def build_pdf_buffer(results: dict, firm_name: str = "Amberstone Capital", logo_file: str = PDF_LOGO_FILE) -> BytesIO:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.units import mm
+
     buf = BytesIO()
     c = canvas.Canvas(buf, pagesize=A4)
     width, height = A4
@@ -110,27 +121,67 @@ def build_pdf_bytes(results: dict, firm_name: str = "Amberstone Capital", logo_f
         c.drawString(left, y, txt)
         gap(1.2)
 
-    def h2(txt):
-        nonlocal y
-        c.setFont("Helvetica-Bold", 11.5)
-        c.drawString(left, y, txt)
-        gap(0.9)
+    # Section bodies are laid out in one text object (single BT/ET block)
+    # and drawn in one call; y is resynced from the text cursor afterwards.
+    # The active font and leading are tracked separately so repeated lines in
+    # the same style emit no Tf, and a spacing change only emits a TL.
+    to = None
+    cur_font = None
+    cur_leading = None
+
+    def begin_text():
+        nonlocal to, cur_font, cur_leading
+        to = c.beginText(left, y)
+        cur_font = cur_leading = None
+
+    def leading(value):
+        nonlocal cur_leading
+        if cur_leading != value:
+            to.setLeading(value)
+            cur_leading = value
+
+    def font(name, size, lead):
+        nonlocal cur_font, cur_leading
+        if cur_font != (name, size):
+            to.setFont(name, size, leading=lead)
+            cur_font, cur_leading = (name, size), lead
+        else:
+            leading(lead)
 
-    def kv(key, value):
-        nonlocal y
-        c.setFont("Helvetica-Bold", 10)
-        c.drawString(left, y, f"{key}:")
-        c.setFont("Helvetica", 10)
-        c.drawString(left + 55 * mm, y, str(value))
-        gap(0.9)
+    def draw_text():
+        nonlocal y, to
+        c.drawText(to)
+        y = to.getY()
+        to = None
+
+    def skip(mult):
+        # blank line at a custom leading; moveCursor(0, dy) would desync getY()
+        leading(6 * mm * mult)
+        to.textLine()
+
+    def h2(txt):
+        font("Helvetica-Bold", 11.5, 6 * mm * 0.9)
+        to.textLine(txt)
+
+    def kv_rows(rows):
+        # Key column first, then the value column at the 55mm tab stop, so a
+        # block of rows needs one font change per column instead of per row.
+        y0 = to.getY()
+        font("Helvetica-Bold", 10, 6 * mm * 0.9)
+        for key, _ in rows:
+            to.textLine(f"{key}:")
+        y_end = to.getY()
+        to.setTextOrigin(left + 55 * mm, y0)
+        font("Helvetica", 10, 6 * mm * 0.9)
+        for _, value in rows:
+            to.textLine(str(value))
+        to.setTextOrigin(left, y_end)
 
     def para(txt, max_chars=110):
-        nonlocal y
-        c.setFont("Helvetica", 10)
+        font("Helvetica", 10, 6 * mm * 0.75)
         for ln in wrap_text_to_lines(txt, max_chars=max_chars):
-            c.drawString(left, y, ln)
-            gap(0.75)
-        gap(0.25)
+            to.textLine(ln)
+        skip(0.25)
 
     # --- Logo (PDF-only) ---
     logo = load_logo_for_pdf(logo_file)
@@ -152,39 +203,50 @@ def build_pdf_bytes(results: dict, firm_name: str = "Amberstone Capital", logo_f
     rule()
 
     # Summary
+    begin_text()
     h2("Summary")
-    kv("Risk attitude score", f"{results['risk_attitude_score']}/100")
-    kv("Risk attitude category", results["risk_attitude_band"])
-    kv("Capacity for loss", results["capacity_band"])
-    kv("Capacity points", f"{results['cap_points']}/30")
-    kv("Capacity policy cap", results["capacity_max_allowed_band"])
-    kv("Final risk category", results["final_band"])
-    kv("Capacity override applied", "Yes" if results["override_applied"] else "No")
+    kv_rows((
+        ("Risk attitude score", f"{results['risk_attitude_score']}/100"),
+        ("Risk attitude category", results["risk_attitude_band"]),
+        ("Capacity for loss", results["capacity_band"]),
+        ("Capacity points", f"{results['cap_points']}/30"),
+        ("Capacity policy cap", results["capacity_max_allowed_band"]),
+        ("Final risk category", results["final_band"]),
+        ("Capacity override applied", "Yes" if results["override_applied"] else "No"),
+    ))
+    draw_text()
     rule()
 
     # Allocation caps
+    begin_text()
     h2("Allocation Caps")
     base_limits = results["base_limits"]
     final_limits = results["final_limits"]
 
-    kv("Base Max Equity", f"{base_limits['max_equity']}%")
-    kv("Base Max Sukuk", f"{base_limits['max_sukuk']}%")
-    kv("Base Max Alternatives", f"{base_limits['max_alternatives']}%")
-    gap(0.2)
-    kv("Final Max Equity", f"{final_limits['max_equity']}%")
-    kv("Final Max Sukuk", f"{final_limits['max_sukuk']}%")
-    kv("Final Max Alternatives", f"{final_limits['max_alternatives']}%")
+    kv_rows((
+        ("Base Max Equity", f"{base_limits['max_equity']}%"),
+        ("Base Max Sukuk", f"{base_limits['max_sukuk']}%"),
+        ("Base Max Alternatives", f"{base_limits['max_alternatives']}%"),
+    ))
+    skip(0.2)
+    kv_rows((
+        ("Final Max Equity", f"{final_limits['max_equity']}%"),
+        ("Final Max Sukuk", f"{final_limits['max_sukuk']}%"),
+        ("Final Max Alternatives", f"{final_limits['max_alternatives']}%"),
+    ))
 
     if results["alt_forced_zero_reasons"]:
-        gap(0.2)
+        skip(0.2)
         h2("Alternatives Gating")
         para("Alternatives were gated to 0% due to:")
         for r in results["alt_forced_zero_reasons"]:
             para(f"• {r}", max_chars=110)
 
+    draw_text()
     rule()
 
     # Robustness
+    begin_text()
     h2("Robustness Checks")
     if results["flags"]:
         para("Flags:")
@@ -192,41 +254,64 @@ def build_pdf_bytes(results: dict, firm_name: str = "Amberstone Capital", logo_f
             para(f"• {f}", max_chars=110)
     else:
         para("No robustness flags triggered.")
+    draw_text()
     rule()
 
     # Capacity inputs
+    begin_text()
     h2("Capacity Inputs")
     cap = results["capacity_inputs"]
-    kv("Emergency fund", cap["emergency_months"])
-    kv("Income stability", cap["income_stability"])
-    kv("Withdrawal likelihood (3y)", cap["withdrawal_need"])
-    kv("Debt burden", cap["debt_burden"])
-    kv("Portfolio dependence (3–5y)", cap["portfolio_dependence"])
+    kv_rows((
+        ("Emergency fund", cap["emergency_months"]),
+        ("Income stability", cap["income_stability"]),
+        ("Withdrawal likelihood (3y)", cap["withdrawal_need"]),
+        ("Debt burden", cap["debt_burden"]),
+        ("Portfolio dependence (3–5y)", cap["portfolio_dependence"]),
+    ))
+    draw_text()
     rule()
 
     # Footer disclaimer
-    c.setFont("Helvetica-Oblique", 9)
     disclaimer = (
         "Internal advisory tool only. This document provides risk profiling information, not investment advice. "
         "Final suitability decisions rest with the adviser."
     )
+    begin_text()
+    font("Helvetica-Oblique", 9, 6 * mm * 0.7)
     for ln in wrap_text_to_lines(disclaimer, max_chars=120):
-        c.drawString(left, y, ln)
-        gap(0.7)
+        to.textLine(ln)
+    draw_text()
 
     c.showPage()
     c.save()
-    return buf.getvalue()
+    # Hand back the rewound buffer; st.download_button reads file-like data
+    buf.seek(0)
+    return buf
+
+# The PDF is deterministic for a given results dict and logo file, so reruns
+# of the Results page reuse it. The canonical JSON string plus the logo's
+# mtime is the cache key (matching the logo reader cache, so replacing the
+# logo invalidates both); the cache is bounded in size and age like
+# compute_results_cached.
+@st.cache_data(ttl="30m", max_entries=64, show_spinner=False)
+def _cached_pdf(results_key: str, firm_name: str, logo_file: str, logo_mtime_ns: int) -> BytesIO:
+    return build_pdf_buffer(json.loads(results_key), firm_name=firm_name, logo_file=logo_file)
+
+def build_pdf_cached(results: dict, firm_name: str = "Amberstone Capital", logo_file: str = PDF_LOGO_FILE) -> BytesIO:
+    p = Path(logo_file)
+    logo_mtime_ns = p.stat().st_mtime_ns if p.exists() else 0
+    return _cached_pdf(json.dumps(results, sort_keys=True), firm_name, logo_file, logo_mtime_ns)
 
 # ============================================================
 # CSS – Theme #1 + very tight divider under nav
+# - built once per process (cache_resource), not re-formatted per rerun
 # ============================================================
-st.markdown(
-    f"""
+@st.cache_resource(show_spinner=False)
+def _build_css_block() -> str:
+    return f"""
     <style>
       .stApp {{
         background-color: {BG};
-        color: {TEXT};
       }}
 
       /* Show top edge of header reliably */
@@ -244,6 +329,15 @@ st.markdown(
       .stCaption, small {{
         color: {MUTED} !important;
       }}
+      .amber-subtitle, .summary-label {{
+        color: {MUTED};
+      }}
+
+      /* Panel surfaces (header + summary cards) */
+      .amber-header, .summary-card {{
+        background: {PANEL};
+        border: 1px solid {BORDER};
+      }}
 
       /* IMPORTANT: Streamlit divider from st.markdown('---') is a <hr> inside stMarkdown.
          Make it VERY tight. This is the correct selector that actually works. */
@@ -255,16 +349,13 @@ st.markdown(
       }}
 
       .amber-header {{
-        background: {PANEL};
-        border: 1px solid {BORDER};
         border-radius: 18px;
-        padding: 1.35rem 1.35rem;
+        padding: 1.35rem;
         margin-top: 0.2rem;
         margin-bottom: 0.35rem;   /* tighter to nav */
       }}
 
       .amber-title {{
-        color: {TEXT};
         font-size: 2.4rem;
         font-weight: 750;
         margin: 0;
@@ -272,7 +363,6 @@ st.markdown(
       }}
 
       .amber-subtitle {{
-        color: {MUTED};
         font-size: 1.15rem;
         margin-top: 0.45rem;
       }}
@@ -286,11 +376,12 @@ st.markdown(
         opacity: 0.85;
       }}
 
-      .card {{
+      /* Page cards: st.container(border=True, key="card_...") */
+      .st-key-card_questionnaire, .st-key-card_results {{
         background: {PANEL_2};
-        border: 1px solid {BORDER};
-        border-radius: 16px;
-        padding: 1.1rem 1.1rem;
+        border-color: {BORDER} !important;
+        border-radius: 16px !important;
+        padding: 1.1rem;
       }}
 
       /* Summary cards */
@@ -299,22 +390,24 @@ st.markdown(
         grid-template-columns: repeat(3, minmax(0, 1fr));
         gap: 14px;
       }}
+      /* Allocation caps: base vs final side by side */
+      .caps-grid {{
+        display: grid;
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+        gap: 14px;
+      }}
       @media (max-width: 900px) {{
-        .summary-grid {{ grid-template-columns: 1fr; }}
+        .summary-grid, .caps-grid {{ grid-template-columns: 1fr; }}
       }}
       .summary-card {{
-        background: {PANEL};
-        border: 1px solid {BORDER};
         border-radius: 16px;
-        padding: 1rem 1rem;
+        padding: 1rem;
       }}
       .summary-label {{
-        color: {MUTED};
         font-size: 0.95rem;
         margin-bottom: 0.35rem;
       }}
       .summary-value {{
-        color: {TEXT};
         font-size: 1.55rem;
         font-weight: 700;
         line-height: 1.25;
@@ -334,14 +427,14 @@ st.markdown(
       div[data-testid="stRadio"] div[role="radiogroup"] {{
         justify-content: center;
       }}
-      div[data-testid="stRadio"] div[role="radiogroup"] label span {{
+      div[data-testid="stRadio"] div[role="radiogroup"] label span,
+      div[data-testid="stSelectbox"] div[role="button"] {{
         font-size: 1.10rem !important;
+      }}
+      div[data-testid="stRadio"] div[role="radiogroup"] label span {{
         font-weight: 550 !important;
         white-space: nowrap !important;
       }}
-      div[data-testid="stSelectbox"] div[role="button"] {{
-        font-size: 1.10rem !important;
-      }}
 
       /* Nav buttons: compact and subtle */
       .navbtn button {{
@@ -367,7 +460,6 @@ st.markdown(
         background-color: #26335a !important;
       }}
 
-
       /* --- Responsive header (Option 2: mobile-friendly but consistent branding) --- */
       .amber-header .header-row {{
         display: flex;
@@ -388,13 +480,9 @@ st.markdown(
         min-width: 0;
       }}
 
-      .amber-header .brand-subtitle {{
-        white-space: normal;
-      }}
-
       @media (max-width: 600px) {{
         .amber-header {{
-          padding: 1.1rem 1.1rem;
+          padding: 1.1rem;
         }}
         .amber-header .header-row {{
           gap: 12px;
@@ -413,17 +501,18 @@ st.markdown(
         }}
       }}
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+_CSS_BLOCK = _build_css_block()
+st.markdown(_CSS_BLOCK, unsafe_allow_html=True)
 
 # ============================================================
-# UI LOGO (base64)
+# UI LOGO (static file: referenced by URL so the browser caches it instead
+# of receiving an inline base64 copy on every rerun)
 # ============================================================
-logo_b64 = load_logo_base64(UI_LOGO_FILE)
 logo_html = (
-    f"<img class='brand-logo' src='data:image/png;base64,{logo_b64}' style='height:auto;' />"
-    if logo_b64
+    f"<img class='brand-logo' src='{UI_LOGO_URL}' style='height:auto;' />"
+    if Path(UI_LOGO_FILE).exists()
     else '<div style="color:#fff; font-weight:700;">[Logo_white.png missing]</div>'
 )
 
@@ -437,7 +526,7 @@ st.markdown(
         <div>{logo_html}</div>
         <div class="brand-text">
           <div class="amber-title">Amberstone – Client Risk Profiler</div>
-          <div class="amber-subtitle brand-subtitle">
+          <div class="amber-subtitle">
             Internal risk-profiling tool (Risk Attitude + Capacity for Loss). Outputs maximum strategic allocation caps only.
           </div>
         </div>
@@ -451,34 +540,32 @@ st.markdown(
 # ============================================================
 # STATE / NAV
 # ============================================================
-if "page" not in st.session_state:
-    st.session_state.page = "questionnaire"
-if "results" not in st.session_state:
-    st.session_state.results = None
+st.session_state.setdefault("page", "questionnaire")
+st.session_state.setdefault("results", None)
 
+# Nav buttons use on_click callbacks: the callback runs before the rerun that
+# the click already triggers, so the new page renders without a second pass.
 def go_questionnaire():
     st.session_state.page = "questionnaire"
-    st.rerun()
 
 def go_results():
     st.session_state.page = "results"
-    st.rerun()
 
 # Nav buttons under header
 nav_left, nav_right = st.columns([1, 1])
 with nav_left:
     st.markdown('<div class="navbtn">', unsafe_allow_html=True)
-    if st.button("Questionnaire", use_container_width=True):
-        go_questionnaire()
+    st.button("Questionnaire", use_container_width=True, on_click=go_questionnaire)
     st.markdown("</div>", unsafe_allow_html=True)
 
 with nav_right:
     st.markdown('<div class="navbtn">', unsafe_allow_html=True)
-    if st.session_state.results is None:
-        st.button("Results", use_container_width=True, disabled=True)
-    else:
-        if st.button("Results", use_container_width=True):
-            go_results()
+    st.button(
+        "Results",
+        use_container_width=True,
+        disabled=st.session_state.results is None,
+        on_click=go_results,
+    )
     st.markdown("</div>", unsafe_allow_html=True)
 
 # This divider is now VERY tight due to the CSS selector above
@@ -487,9 +574,9 @@ st.markdown("---")
 # ============================================================
 # DEFINITIONS
 # ============================================================
-with st.expander("Definitions & advisory notes", expanded=False):
-    st.markdown(
-        """
+# Rendered only while the toggle is on; a collapsed st.expander would still
+# send the body to the browser on every rerun.
+_DEFS_MD = """
 **Alternatives (current scope):**
 - Publicly traded **REITs**
 - Publicly traded **commodity funds**
@@ -498,13 +585,15 @@ with st.expander("Definitions & advisory notes", expanded=False):
 **Reminder (advisory use):**
 - Risk attitude ≠ suitability by itself. Also consider time horizon, need to take risk, and liquidity needs.
 - This tool outputs **maximum caps**, not target allocations.
-        """
-    )
+"""
+
+if st.toggle("Definitions & advisory notes", value=False, key="show_defs"):
+    st.markdown(_DEFS_MD)
 
 # ============================================================
 # CORE LOGIC DATA
 # ============================================================
-LIKERT = ["Strongly agree", "Agree", "No strong opinion", "Disagree", "Strongly disagree"]
+LIKERT = ("Strongly agree", "Agree", "No strong opinion", "Disagree", "Strongly disagree")
 LIKERT_TO_NUM = {
     "Strongly disagree": 1,
     "Disagree": 2,
@@ -512,6 +601,9 @@ LIKERT_TO_NUM = {
     "Agree": 4,
     "Strongly agree": 5,
 }
+# Radios store the 0-based LIKERT index; this table maps index -> raw 1..5
+LIKERT_OPTIONS = tuple(range(len(LIKERT)))
+_LIKERT_RAW = np.array([LIKERT_TO_NUM[label] for label in LIKERT], dtype=np.int8)
 
 ITEMS = [
     ("People who know me would describe me as cautious with money.", False),
@@ -528,29 +620,39 @@ ITEMS = [
     ("I’m not comfortable with the short-term swings that markets can experience.", False),
 ]
 
-def category_from_score(score_0_100: int) -> str:
-    if score_0_100 <= 25:
-        return "Very Cautious (0–25)"
-    if score_0_100 <= 33:
-        return "Cautious (26–33)"
-    if score_0_100 <= 44:
-        return "Moderately Cautious (34–44)"
-    if score_0_100 <= 56:
-        return "Balanced (45–56)"
-    if score_0_100 <= 67:
-        return "Moderately Venturesome  (57–67)"
-    if score_0_100 <= 79:
-        return "Venturesome (68–79)"
-    return "Very Venturesome (80–100)"
+# Reverse scoring as arithmetic: scored = offset + sign * raw
+# (normal items: 0 + raw, reversed items: 6 - raw)
+_SIGNS = np.array([1 if is_normal else -1 for _, is_normal in ITEMS], dtype=np.int8)
+_OFFSETS = np.where(_SIGNS == 1, 0, 6).astype(np.int8)
+
+# Capacity-for-loss selectbox options (worst -> best) and their points
+EMERGENCY_OPTS = ("< 3 months", "3–6 months", "6–12 months", "12+ months")
+INCOME_OPTS = ("Unstable/variable", "Somewhat stable", "Stable (salaried/contracted)", "Very stable (multiple reliable sources)")
+WITHDRAWAL_OPTS = ("Very likely", "Somewhat likely", "Unlikely", "Very unlikely")
+DEBT_OPTS = ("High / hard to service", "Moderate", "Low", "None")
+DEPENDENCE_OPTS = ("Highly dependent", "Somewhat dependent", "Not very dependent", "Not dependent")
+
+_CAPACITY_OPTION_POINTS = (0, 2, 4, 6)
+EMERGENCY_POINTS = dict(zip(EMERGENCY_OPTS, _CAPACITY_OPTION_POINTS))
+INCOME_POINTS = dict(zip(INCOME_OPTS, _CAPACITY_OPTION_POINTS))
+WITHDRAWAL_POINTS = dict(zip(WITHDRAWAL_OPTS, _CAPACITY_OPTION_POINTS))
+DEBT_POINTS = dict(zip(DEBT_OPTS, _CAPACITY_OPTION_POINTS))
+DEPENDENCE_POINTS = dict(zip(DEPENDENCE_OPTS, _CAPACITY_OPTION_POINTS))
+
+# Questionnaire widget labels/keys, built with ITEMS rather than inside the form loop
+ITEM_LABELS = tuple(f"{i}) {statement}" for i, (statement, _) in enumerate(ITEMS, start=1))
+ITEM_KEYS = tuple(f"att_{i}" for i in range(1, len(ITEMS) + 1))
+
+Policy = namedtuple("Policy", "max_equity max_sukuk max_alternatives")
 
 MAX_POLICY = {
-    "Very Cautious (0–25)": {"max_equity": 0,  "max_sukuk": 100, "max_alternatives": 0},
-    "Cautious (26–33)": {"max_equity": 20, "max_sukuk": 80,  "max_alternatives": 0},
-    "Moderately Cautious (34–44)": {"max_equity": 30, "max_sukuk": 70, "max_alternatives": 0},
-    "Balanced (45–56)": {"max_equity": 40, "max_sukuk": 60, "max_alternatives": 0},
-    "Moderately Venturesome (57–67)": {"max_equity": 60, "max_sukuk": 35, "max_alternatives": 5},
-    "Venturesome (68–79)": {"max_equity": 70, "max_sukuk": 20, "max_alternatives": 10},
-    "Very Venturesome (80–100)": {"max_equity": 70, "max_sukuk": 0, "max_alternatives": 30},
+    "Very Cautious (0–25)": Policy(max_equity=0,  max_sukuk=100, max_alternatives=0),
+    "Cautious (26–33)": Policy(max_equity=20, max_sukuk=80,  max_alternatives=0),
+    "Moderately Cautious (34–44)": Policy(max_equity=30, max_sukuk=70, max_alternatives=0),
+    "Balanced (45–56)": Policy(max_equity=40, max_sukuk=60, max_alternatives=0),
+    "Moderately Venturesome (57–67)": Policy(max_equity=60, max_sukuk=35, max_alternatives=5),
+    "Venturesome (68–79)": Policy(max_equity=70, max_sukuk=20, max_alternatives=10),
+    "Very Venturesome (80–100)": Policy(max_equity=70, max_sukuk=0, max_alternatives=30),
 }
 
 BAND_ORDER = [
@@ -562,69 +664,70 @@ BAND_ORDER = [
     "Venturesome (68–79)",
     "Very Venturesome (80–100)",
 ]
+_BAND_RANK = {b: i for i, b in enumerate(BAND_ORDER)}
+
+# Inclusive upper score limit of each band except the last (bisect_left keeps
+# a score equal to a limit inside that band).
+_SCORE_THRESHOLDS = (25, 33, 44, 56, 67, 79)
+
+def category_from_score(score_0_100: int) -> str:
+    return BAND_ORDER[bisect_left(_SCORE_THRESHOLDS, score_0_100)]
+
+CAPACITY_BANDS = ("Low capacity for loss", "Medium capacity for loss", "High capacity for loss")
+_CAPACITY_THRESHOLDS = (10, 20)
+
+CAPACITY_MAX_BAND = {
+    "Low capacity for loss": "Moderately Cautious (34–44)",
+    "Medium capacity for loss": "Balanced (45–56)",
+    "High capacity for loss": "Very Venturesome (80–100)",
+}
 
 def band_at_or_below(current_band: str, max_band: str) -> str:
-    return BAND_ORDER[min(BAND_ORDER.index(current_band), BAND_ORDER.index(max_band))]
+    return BAND_ORDER[min(_BAND_RANK[current_band], _BAND_RANK[max_band])]
 
-def compute_results(inputs: dict) -> dict:
+Inputs = namedtuple(
+    "Inputs",
+    "attitude_choices emergency_months income_stability withdrawal_need debt_burden "
+    "portfolio_dependence alt_scope_reits alt_scope_commodities alt_equities_toggle "
+    "limited_experience_gate",
+)
+
+def compute_results(inputs: Inputs) -> dict:
     # Risk attitude scoring
-    responses_scored = []
-    responses_raw = []
-    neutral_count = 0
-
-    for (_, is_normal), choice in zip(ITEMS, inputs["attitude_choices"]):
-        if choice == "No strong opinion":
-            neutral_count += 1
-        raw = LIKERT_TO_NUM[choice]
-        scored = raw if is_normal else (6 - raw)
-        responses_raw.append(raw)
-        responses_scored.append(scored)
-
-    raw_total = sum(responses_scored)  # 12..60
+    responses_raw = np.take(_LIKERT_RAW, np.asarray(inputs.attitude_choices, dtype=np.intp))
+    responses_scored = _OFFSETS + _SIGNS * responses_raw
+    neutral_count = int((responses_raw == 3).sum())
+
+    raw_total = int(responses_scored.sum())  # 12..60
     risk_attitude_score = round((raw_total - 12) / (60 - 12) * 100)
     risk_attitude_band = category_from_score(risk_attitude_score)
 
     # Capacity for loss scoring
-    emergency_months = inputs["emergency_months"]
-    income_stability = inputs["income_stability"]
-    withdrawal_need = inputs["withdrawal_need"]
-    debt_burden = inputs["debt_burden"]
-    portfolio_dependence = inputs["portfolio_dependence"]
-
-    cap_points = 0
-    cap_points += {"< 3 months": 0, "3–6 months": 2, "6–12 months": 4, "12+ months": 6}[emergency_months]
-    cap_points += {
-        "Unstable/variable": 0,
-        "Somewhat stable": 2,
-        "Stable (salaried/contracted)": 4,
-        "Very stable (multiple reliable sources)": 6,
-    }[income_stability]
-    cap_points += {"Very likely": 0, "Somewhat likely": 2, "Unlikely": 4, "Very unlikely": 6}[withdrawal_need]
-    cap_points += {"High / hard to service": 0, "Moderate": 2, "Low": 4, "None": 6}[debt_burden]
-    cap_points += {"Highly dependent": 0, "Somewhat dependent": 2, "Not very dependent": 4, "Not dependent": 6}[portfolio_dependence]
-
-    if cap_points <= 10:
-        capacity_band = "Low capacity for loss"
-    elif cap_points <= 20:
-        capacity_band = "Medium capacity for loss"
-    else:
-        capacity_band = "High capacity for loss"
+    emergency_months = inputs.emergency_months
+    income_stability = inputs.income_stability
+    withdrawal_need = inputs.withdrawal_need
+    debt_burden = inputs.debt_burden
+    portfolio_dependence = inputs.portfolio_dependence
+
+    cap_points = (
+        EMERGENCY_POINTS[emergency_months]
+        + INCOME_POINTS[income_stability]
+        + WITHDRAWAL_POINTS[withdrawal_need]
+        + DEBT_POINTS[debt_burden]
+        + DEPENDENCE_POINTS[portfolio_dependence]
+    )
 
-    CAPACITY_MAX_BAND = {
-        "Low capacity for loss": "Moderately Cautious (34–44)",
-        "Medium capacity for loss": "Balanced (45–56)",
-        "High capacity for loss": "Very Venturesome (80–100)",
-    }
+    capacity_band = CAPACITY_BANDS[bisect_left(_CAPACITY_THRESHOLDS, cap_points)]
     capacity_max_allowed_band = CAPACITY_MAX_BAND[capacity_band]
 
     final_band = band_at_or_below(risk_attitude_band, capacity_max_allowed_band)
     override_applied = final_band != risk_attitude_band
 
     # Alternatives gating
-    limited_experience = responses_raw[8] >= 4
+    limited_experience = bool(responses_raw[8] >= 4)
     needs_liquidity_soon = withdrawal_need in ["Very likely", "Somewhat likely"]
     low_capacity = capacity_band == "Low capacity for loss"
-    limited_experience_gate = inputs["limited_experience_gate"]
+    limited_experience_gate = inputs.limited_experience_gate
 
     alt_forced_zero_reasons = []
     if needs_liquidity_soon:
@@ -634,21 +737,22 @@ def compute_results(inputs: dict) -> dict:
     if limited_experience_gate and limited_experience:
         alt_forced_zero_reasons.append("Client indicates limited investment experience")
 
-    base_limits = MAX_POLICY[final_band].copy()
-    final_limits = base_limits.copy()
-
-    if alt_forced_zero_reasons:
-        final_limits["max_alternatives"] = 0
-
-    removed_alt = base_limits["max_alternatives"] - final_limits["max_alternatives"]
-    if removed_alt > 0:
-        final_limits["max_sukuk"] = min(100, final_limits["max_sukuk"] + removed_alt)
+    # Gated Alternatives capacity is moved into Sukuk
+    base_limits = MAX_POLICY[final_band]
+    final_limits = (
+        base_limits._replace(
+            max_alternatives=0,
+            max_sukuk=min(100, base_limits.max_sukuk + base_limits.max_alternatives),
+        )
+        if alt_forced_zero_reasons
+        else base_limits
+    )
 
     # Robustness flags
     flags = []
     if neutral_count >= 6:
         flags.append("Many neutral answers (6+). Consider clarifying and reassessing.")
-    raw_stmt12 = responses_raw[11]
+    raw_stmt12 = int(responses_raw[11])
     if risk_attitude_score >= 68 and raw_stmt12 >= 4:
         flags.append("High score but strong discomfort with market swings—discuss suitability carefully.")
     if risk_attitude_score >= 68 and limited_experience:
@@ -656,11 +760,11 @@ def compute_results(inputs: dict) -> dict:
 
     # Alternatives scope text
     alts_in_scope = []
-    if inputs["alt_scope_reits"]:
+    if inputs.alt_scope_reits:
         alts_in_scope.append("Public REITs")
-    if inputs["alt_scope_commodities"]:
+    if inputs.alt_scope_commodities:
         alts_in_scope.append("Commodity funds")
-    if inputs["alt_equities_toggle"]:
+    if inputs.alt_equities_toggle:
         alts_in_scope.append("Selected equities treated as 'alternative-like' (internal classification)")
 
     return {
@@ -672,8 +776,8 @@ def compute_results(inputs: dict) -> dict:
         "capacity_max_allowed_band": capacity_max_allowed_band,
         "final_band": final_band,
         "override_applied": override_applied,
-        "base_limits": base_limits,
-        "final_limits": final_limits,
+        "base_limits": base_limits._asdict(),
+        "final_limits": final_limits._asdict(),
         "alt_forced_zero_reasons": alt_forced_zero_reasons,
         "flags": flags,
         "alts_in_scope": alts_in_scope,
@@ -686,141 +790,77 @@ def compute_results(inputs: dict) -> dict:
         },
     }
 
-# ============================================================
-# QUESTIONNAIRE PAGE
-# ============================================================
-if st.session_state.page == "questionnaire":
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.subheader("Questionnaire")
-
-    with st.form("risk_profiler_form", clear_on_submit=False):
-        st.markdown("### A) Risk attitude")
-        attitude_choices = []
-        for i, (statement, _) in enumerate(ITEMS, start=1):
-            choice = st.radio(
-                f"{i}) {statement}",
-                LIKERT,
-                index=None,
-                horizontal=True,
-                key=f"att_{i}",
-            )
-            attitude_choices.append(choice)
+# Questionnaire inputs as a small int tuple (cheap to hash as a cache key)
+def inputs_fingerprint(inputs: Inputs) -> tuple[int, ...]:
+    return (
+        *inputs.attitude_choices,
+        EMERGENCY_OPTS.index(inputs.emergency_months),
+        INCOME_OPTS.index(inputs.income_stability),
+        WITHDRAWAL_OPTS.index(inputs.withdrawal_need),
+        DEBT_OPTS.index(inputs.debt_burden),
+        DEPENDENCE_OPTS.index(inputs.portfolio_dependence),
+        int(inputs.alt_scope_reits),
+        int(inputs.alt_scope_commodities),
+        int(inputs.alt_equities_toggle),
+        int(inputs.limited_experience_gate),
+    )
 
-        st.markdown("---")
-        st.markdown("### B) Capacity for loss")
+# Inverse of inputs_fingerprint (option indices back to their labels)
+def inputs_from_fingerprint(fingerprint: tuple[int, ...]) -> Inputs:
+    n = len(ITEMS)
+    emergency, income, withdrawal, debt, dependence, reits, cmdty, eq, gate = fingerprint[n:]
+    return Inputs(
+        attitude_choices=tuple(fingerprint[:n]),
+        emergency_months=EMERGENCY_OPTS[emergency],
+        income_stability=INCOME_OPTS[income],
+        withdrawal_need=WITHDRAWAL_OPTS[withdrawal],
+        debt_burden=DEBT_OPTS[debt],
+        portfolio_dependence=DEPENDENCE_OPTS[dependence],
+        alt_scope_reits=bool(reits),
+        alt_scope_commodities=bool(cmdty),
+        alt_equities_toggle=bool(eq),
+        limited_experience_gate=bool(gate),
+    )
 
-        emergency_months = st.selectbox(
-            "1) Months of essential expenses held in readily accessible cash/cash-equivalents",
-            ["< 3 months", "3–6 months", "6–12 months", "12+ months"],
-            index=None,
-            key="cap_emergency",
-        )
-        income_stability = st.selectbox(
-            "2) Income stability",
-            ["Unstable/variable", "Somewhat stable", "Stable (salaried/contracted)", "Very stable (multiple reliable sources)"],
-            index=None,
-            key="cap_income",
-        )
-        withdrawal_need = st.selectbox(
-            "3) Likelihood of needing a large withdrawal in the next 3 years",
-            ["Very likely", "Somewhat likely", "Unlikely", "Very unlikely"],
-            index=None,
-            key="cap_withdrawal",
-        )
-        debt_burden = st.selectbox(
-            "4) Debt burden (excluding a manageable primary residence mortgage, if applicable)",
-            ["High / hard to service", "Moderate", "Low", "None"],
-            index=None,
-            key="cap_debt",
-        )
-        portfolio_dependence = st.selectbox(
-            "5) Dependence on this portfolio for near-term living costs (next 3–5 years)",
-            ["Highly dependent", "Somewhat dependent", "Not very dependent", "Not dependent"],
-            index=None,
-            key="cap_dependence",
-        )
+# compute_results is a pure function of the answers, so identical submissions
+# are served from a bounded memo table. The fingerprint is both the cache key
+# and the only input, so a key can never be paired with another submission.
+@st.cache_data(ttl="1h", max_entries=256, show_spinner=False)
+def compute_results_cached(fingerprint: tuple[int, ...]) -> dict:
+    return compute_results(inputs_from_fingerprint(fingerprint))
 
-        st.markdown("---")
-        st.markdown("### C) Alternatives scope & gates")
-
-        alt_scope_reits = st.checkbox("Include publicly traded REITs as Alternatives", value=True, key="alt_reits")
-        alt_scope_commodities = st.checkbox("Include commodity funds as Alternatives", value=True, key="alt_cmdty")
-        alt_equities_toggle = st.checkbox(
-            "Allow some publicly traded equities to be treated as 'alternative-like' internally (optional)",
-            value=False,
-            key="alt_eq",
+# ============================================================
+# RESULTS PAGE (ALL SECTIONS)
+# - a fragment: interactions inside it (e.g. the download button) rerun
+#   only this function, not the header/nav/questionnaire above
+# ============================================================
+@st.fragment
+def render_results(results: dict):
+    with st.container(border=True, key="card_results"):
+        st.subheader("Results")
+
+        # Static sections are fused into one markdown payload each (one
+        # frontend message instead of one per line).
+        summary_fields = (
+            ("Risk attitude score", f"{results['risk_attitude_score']}/100"),
+            ("Risk attitude category", results["risk_attitude_band"]),
+            ("Capacity for loss", results["capacity_band"]),
         )
-        limited_experience_gate = st.checkbox(
-            "Gate Alternatives to 0% if client indicates limited investment experience",
-            value=True,
-            key="alt_gate_exp",
+        summary_cards = "".join(
+            f'<div class="summary-card"><div class="summary-label">{label}</div>'
+            f'<div class="summary-value">{value}</div></div>'
+            for label, value in summary_fields
         )
+        summary_md = f"""
+        ### Summary
 
-        submitted = st.form_submit_button("Submit and view results →", type="primary")
-
-    if submitted:
-        missing = []
-        for idx, v in enumerate(attitude_choices, start=1):
-            if v is None:
-                missing.append(f"Risk attitude question {idx}")
-        if emergency_months is None: missing.append("Capacity: emergency fund")
-        if income_stability is None: missing.append("Capacity: income stability")
-        if withdrawal_need is None: missing.append("Capacity: withdrawal likelihood")
-        if debt_burden is None: missing.append("Capacity: debt burden")
-        if portfolio_dependence is None: missing.append("Capacity: portfolio dependence")
-
-        if missing:
-            st.error("Please answer all questions before viewing results.\n\nMissing:\n- " + "\n- ".join(missing))
-        else:
-            inputs = {
-                "attitude_choices": attitude_choices,
-                "emergency_months": emergency_months,
-                "income_stability": income_stability,
-                "withdrawal_need": withdrawal_need,
-                "debt_burden": debt_burden,
-                "portfolio_dependence": portfolio_dependence,
-                "alt_scope_reits": alt_scope_reits,
-                "alt_scope_commodities": alt_scope_commodities,
-                "alt_equities_toggle": alt_equities_toggle,
-                "limited_experience_gate": limited_experience_gate,
-            }
-            st.session_state.results = compute_results(inputs)
-            go_results()
+        <div class="summary-grid">{summary_cards}</div>
 
-    st.markdown("</div>", unsafe_allow_html=True)
+        **Capacity points:** {results['cap_points']}/30
 
-# ============================================================
-# RESULTS PAGE (ALL SECTIONS)
-# ============================================================
-else:
-    results = st.session_state.results
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.subheader("Results")
-
-    if results is None:
-        st.info("No results found. Please complete the questionnaire first.")
-    else:
-        st.markdown("### Summary")
-        summary_html = f"""
-        <div class="summary-grid">
-          <div class="summary-card">
-            <div class="summary-label">Risk attitude score</div>
-            <div class="summary-value">{results['risk_attitude_score']}/100</div>
-          </div>
-          <div class="summary-card">
-            <div class="summary-label">Risk attitude category</div>
-            <div class="summary-value">{results['risk_attitude_band']}</div>
-          </div>
-          <div class="summary-card">
-            <div class="summary-label">Capacity for loss</div>
-            <div class="summary-value">{results['capacity_band']}</div>
-          </div>
-        </div>
+        **Capacity policy cap:** {results['capacity_max_allowed_band']}
         """
-        st.markdown(summary_html, unsafe_allow_html=True)
-
-        st.write(f"**Capacity points:** {results['cap_points']}/30")
-        st.write(f"**Capacity policy cap:** {results['capacity_max_allowed_band']}")
+        st.markdown(summary_md, unsafe_allow_html=True)
 
         if results["override_applied"]:
             st.warning(
@@ -832,48 +872,67 @@ else:
 
         st.markdown("---")
         st.markdown("### Export")
-        pdf_bytes = build_pdf_bytes(results, firm_name="Amberstone Capital", logo_file=PDF_LOGO_FILE)
-        pdf_filename = f"Amberstone_Risk_Profile_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+        pdf_buf = build_pdf_cached(results, firm_name="Amberstone Capital", logo_file=PDF_LOGO_FILE)
+        pdf_filename = f"Amberstone_Risk_Profile_{results['generated_at']}.pdf"
         st.download_button(
             label="Download PDF",
-            data=pdf_bytes,
+            data=pdf_buf,
             file_name=pdf_filename,
             mime="application/pdf",
             type="primary",
         )
 
         st.markdown("---")
-        st.markdown("### Allocation caps")
-        st.write(f"**Final risk category:** {results['final_band']}")
-
         base_limits = results["base_limits"]
         final_limits = results["final_limits"]
 
-        lc, rc = st.columns(2)
-        with lc:
-            st.markdown("**Base policy caps (by final band)**")
-            st.write(f"- Max Equity: {base_limits['max_equity']}%")
-            st.write(f"- Max Sukuk: {base_limits['max_sukuk']}%")
-            st.write(f"- Max Alternatives: {base_limits['max_alternatives']}%")
-        with rc:
-            st.markdown("**Final recommended caps (after gates)**")
-            st.write(f"- Max Equity: {final_limits['max_equity']}%")
-            st.write(f"- Max Sukuk: {final_limits['max_sukuk']}%")
-            st.write(f"- Max Alternatives: {final_limits['max_alternatives']}%")
+        caps_md = f"""
+        ### Allocation caps
+
+        **Final risk category:** {results['final_band']}
+
+        <div class="caps-grid">
+          <div>
+            <strong>Base policy caps (by final band)</strong>
+            <ul>
+              <li>Max Equity: {base_limits['max_equity']}%</li>
+              <li>Max Sukuk: {base_limits['max_sukuk']}%</li>
+              <li>Max Alternatives: {base_limits['max_alternatives']}%</li>
+            </ul>
+          </div>
+          <div>
+            <strong>Final recommended caps (after gates)</strong>
+            <ul>
+              <li>Max Equity: {final_limits['max_equity']}%</li>
+              <li>Max Sukuk: {final_limits['max_sukuk']}%</li>
+              <li>Max Alternatives: {final_limits['max_alternatives']}%</li>
+            </ul>
+          </div>
+        </div>
+        """
+        st.markdown(caps_md, unsafe_allow_html=True)
 
         if results["alt_forced_zero_reasons"]:
-            st.warning("**Alternatives gated to 0%** due to:\n- " + "\n- ".join(results["alt_forced_zero_reasons"]))
+            bullets = "\n- ".join(results["alt_forced_zero_reasons"])
+            st.warning(f"**Alternatives gated to 0%** due to:\n- {bullets}")
 
         st.markdown("---")
         st.markdown("### Robustness checks")
         if results["flags"]:
-            st.warning("Flags:\n- " + "\n- ".join(results["flags"]))
+            bullets = "\n- ".join(results["flags"])
+            st.warning(f"Flags:\n- {bullets}")
         else:
             st.success("No robustness flags triggered.")
 
         st.markdown("---")
         st.markdown("### Client file note (copy/paste)")
         cap_in = results["capacity_inputs"]
+        override_str = "Yes" if results["override_applied"] else "No"
+        alts_in_scope = results["alts_in_scope"]
+        alts_str = ", ".join(alts_in_scope) if alts_in_scope else "None"
+        gate_reasons = results["alt_forced_zero_reasons"]
+        gate_str = f"Gated to 0% ({'; '.join(gate_reasons)})" if gate_reasons else "Not gated"
+        flags_str = "; ".join(results["flags"]) if results["flags"] else "None"
         file_note = f"""
 Amberstone – Risk profiling summary
 
@@ -889,13 +948,13 @@ Capacity for loss:
 
 Final risk category (after capacity cap):
 - {results['final_band']}
-- Capacity override applied: {"Yes" if results["override_applied"] else "No"}
+- Capacity override applied: {override_str}
 
 Alternatives scope:
-- {", ".join(results["alts_in_scope"]) if results["alts_in_scope"] else "None"}
+- {alts_str}
 
 Alternatives gate outcome:
-- {"Gated to 0% (" + "; ".join(results["alt_forced_zero_reasons"]) + ")" if results["alt_forced_zero_reasons"] else "Not gated"}
+- {gate_str}
 
 Base policy caps (by final band):
 - Max Equity: {base_limits['max_equity']}%
@@ -915,11 +974,130 @@ Capacity inputs:
 - Portfolio dependence (3–5y): {cap_in['portfolio_dependence']}
 
 Robustness flags:
-- {"None" if not results["flags"] else "; ".join(results["flags"])}
+- {flags_str}
 """.strip()
         st.code(file_note, language="text")
 
-    st.markdown("</div>", unsafe_allow_html=True)
+# ============================================================
+# QUESTIONNAIRE PAGE
+# - a fragment: submitting with missing answers reruns only the form, not the
+#   header/nav above
+# ============================================================
+@st.fragment
+def render_questionnaire():
+    with st.container(border=True, key="card_questionnaire"):
+        st.subheader("Questionnaire")
+
+        with st.form("risk_profiler_form", clear_on_submit=False):
+            st.markdown("### A) Risk attitude")
+            for label, key in zip(ITEM_LABELS, ITEM_KEYS):
+                st.radio(
+                    label,
+                    LIKERT_OPTIONS,
+                    format_func=LIKERT.__getitem__,
+                    index=None,
+                    horizontal=True,
+                    key=key,
+                )
+
+            st.markdown("---")
+            st.markdown("### B) Capacity for loss")
+
+            emergency_months = st.selectbox(
+                "1) Months of essential expenses held in readily accessible cash/cash-equivalents",
+                EMERGENCY_OPTS,
+                index=None,
+                key="cap_emergency",
+            )
+            income_stability = st.selectbox(
+                "2) Income stability",
+                INCOME_OPTS,
+                index=None,
+                key="cap_income",
+            )
+            withdrawal_need = st.selectbox(
+                "3) Likelihood of needing a large withdrawal in the next 3 years",
+                WITHDRAWAL_OPTS,
+                index=None,
+                key="cap_withdrawal",
+            )
+            debt_burden = st.selectbox(
+                "4) Debt burden (excluding a manageable primary residence mortgage, if applicable)",
+                DEBT_OPTS,
+                index=None,
+                key="cap_debt",
+            )
+            portfolio_dependence = st.selectbox(
+                "5) Dependence on this portfolio for near-term living costs (next 3–5 years)",
+                DEPENDENCE_OPTS,
+                index=None,
+                key="cap_dependence",
+            )
+
+            st.markdown("---")
+            st.markdown("### C) Alternatives scope & gates")
+
+            alt_scope_reits = st.checkbox("Include publicly traded REITs as Alternatives", value=True, key="alt_reits")
+            alt_scope_commodities = st.checkbox("Include commodity funds as Alternatives", value=True, key="alt_cmdty")
+            alt_equities_toggle = st.checkbox(
+                "Allow some publicly traded equities to be treated as 'alternative-like' internally (optional)",
+                value=False,
+                key="alt_eq",
+            )
+            limited_experience_gate = st.checkbox(
+                "Gate Alternatives to 0% if client indicates limited investment experience",
+                value=True,
+                key="alt_gate_exp",
+            )
+
+            submitted = st.form_submit_button("Submit and view results →", type="primary")
+
+        if submitted:
+            # Answers live in session_state under their widget keys
+            attitude_choices = tuple(st.session_state.get(key) for key in ITEM_KEYS)
+            checks = (
+                *((f"Risk attitude question {idx}", v) for idx, v in enumerate(attitude_choices, start=1)),
+                ("Capacity: emergency fund", emergency_months),
+                ("Capacity: income stability", income_stability),
+                ("Capacity: withdrawal likelihood", withdrawal_need),
+                ("Capacity: debt burden", debt_burden),
+                ("Capacity: portfolio dependence", portfolio_dependence),
+            )
+            missing = [name for name, v in checks if v is None]
+
+            if missing:
+                bullets = "\n- ".join(missing)
+                st.error(f"Please answer all questions before viewing results.\n\nMissing:\n- {bullets}")
+            else:
+                inputs = Inputs(
+                    attitude_choices=attitude_choices,
+                    emergency_months=emergency_months,
+                    income_stability=income_stability,
+                    withdrawal_need=withdrawal_need,
+                    debt_burden=debt_burden,
+                    portfolio_dependence=portfolio_dependence,
+                    alt_scope_reits=alt_scope_reits,
+                    alt_scope_commodities=alt_scope_commodities,
+                    alt_equities_toggle=alt_equities_toggle,
+                    limited_experience_gate=limited_experience_gate,
+                )
+                results = compute_results_cached(inputs_fingerprint(inputs))
+                # Stamped per submission (not in the cached function), so the
+                # PDF filename is stable across reruns of the Results page
+                results["generated_at"] = datetime.now().strftime("%Y%m%d_%H%M")
+                st.session_state.results = results
+                go_results()
+                # Full-app rerun (the default scope), so the nav and page
+                # dispatch pick up the new results
+                st.rerun()
+
+# ============================================================
+# PAGE DISPATCH (Results only renders with results present)
+# ============================================================
+if st.session_state.page == "questionnaire" or st.session_state.results is None:
+    render_questionnaire()
+else:
+    render_results(st.session_state.results)
 
 st.markdown("---")
 st.caption(